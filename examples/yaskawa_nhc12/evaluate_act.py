@@ -21,17 +21,34 @@ This script loads a trained ACT model and runs it on the real robot.
 
 Usage:
     python evaluate_act.py --policy_path <hf_username>/<model_name>
+
+    # On CUDA, optionally compile the model and run inference under bf16 autocast
+    python evaluate_act.py --policy_path <hf_username>/<model_name> --compile --bf16
+
+    # On CUDA, alternatively capture the model forward once in a CUDA graph and replay it every step
+    python evaluate_act.py --policy_path <hf_username>/<model_name> --cuda_graphs
 """
 
 import argparse
+import queue
+import threading
 import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from functools import partial
 
+import numpy as np
 import torch
 
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig
-from lerobot.policies.factory import make_policy
+from lerobot.configs.policies import PreTrainedConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.factory import make_pre_post_processors
+from lerobot.processor import PolicyActionToRobotActionProcessorStep, PolicyProcessorPipeline
 from lerobot.robots.yaskawa_nhc12 import YaskawaNHC12Config, YaskawaNHC12Robot
-from lerobot.utils.utils import log_say
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+from lerobot.utils.robot_utils import precise_sleep_until
+from lerobot.utils.utils import log_say, start_log_say_thread
 from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
 
 # ========================================
@@ -73,35 +90,322 @@ JOINT_NAMES = [
     "joint_6",
 ]
 
-JOINT_LIMITS = {
-    "joint_1": (-170.0, 170.0),
-    "joint_2": (-130.0, 90.0),
-    "joint_3": (-170.0, 90.0),
-    "joint_4": (-200.0, 200.0),
-    "joint_5": (-135.0, 135.0),
-    "joint_6": (-360.0, 360.0),
-}
+# (min, max) in degrees for each joint, in JOINT_NAMES order
+JOINT_LIMITS = (
+    (-170.0, 170.0),  # joint_1
+    (-130.0, 90.0),  # joint_2
+    (-170.0, 90.0),  # joint_3
+    (-200.0, 200.0),  # joint_4
+    (-135.0, 135.0),  # joint_5
+    (-360.0, 360.0),  # joint_6
+)
+
+
+class LatestSlot:
+    """
+    Single-slot mailbox shared between two threads.
+
+    Writers always overwrite the stored value (latest wins) so a slow consumer never
+    works through a backlog of stale items.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._value = None
+        self._version = 0
+
+    def put(self, value) -> None:
+        with self._cond:
+            self._value = value
+            self._version += 1
+            self._cond.notify_all()
+
+    def latest(self):
+        """Return the most recent value without blocking (None if nothing was put yet)."""
+        with self._cond:
+            return self._value
+
+    def wait_newer(self, version: int, timeout: float) -> tuple[object, int] | None:
+        """Wait for a value newer than `version`. Returns (value, version), or None on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._version > version, timeout=timeout):
+                return None
+            return self._value, self._version
+
+
+class ObservationStager:
+    """
+    Convert raw robot observations into batched tensors on the inference device.
+
+    This is the `prepare_observation_for_inference` step of `control_utils.predict_action`: the output
+    still goes through the policy preprocessor (normalization). Joint positions and camera frames are
+    copied into host buffers allocated once from the observation spec. On CUDA those buffers are
+    pinned, so the host-to-device copies are issued with `non_blocking=True` and run as async DMA
+    instead of a synchronous pageable copy. A buffer is only refilled on the next call, after the
+    policy has consumed the previous batch and its action has been read back to the host (which
+    waits for all queued copies).
+    """
+
+    def __init__(
+        self,
+        observation_features: dict,
+        device: str,
+        task: str | None = None,
+        robot_type: str | None = None,
+    ):
+        self.device = torch.device(device)
+        self.task = task if task else ""
+        self.robot_type = robot_type if robot_type else ""
+        pin_memory = self.device.type == "cuda"
+        self._state_keys = tuple(key for key, ft in observation_features.items() if ft is float)
+        self._state_buf = torch.empty(len(self._state_keys), dtype=torch.float32, pin_memory=pin_memory)
+        self._image_bufs = {
+            key: torch.empty(shape, dtype=torch.uint8, pin_memory=pin_memory)
+            for key, shape in observation_features.items()
+            if isinstance(shape, tuple)
+        }
+
+    def __call__(self, observation: dict) -> dict:
+        state = np.fromiter(map(observation.__getitem__, self._state_keys), dtype=np.float32)
+        self._state_buf.copy_(torch.from_numpy(state))
+        batch = {OBS_STATE: self._state_buf.to(self.device, non_blocking=True).unsqueeze(0)}
+
+        for key, buf in self._image_bufs.items():
+            buf.copy_(torch.from_numpy(observation[key]))
+            # (H, W, C) uint8 -> (1, C, H, W) float32 in [0, 1], converted on the device
+            image = buf.to(self.device, non_blocking=True).permute(2, 0, 1).unsqueeze(0)
+            batch[f"{OBS_IMAGES}.{key}"] = image.float() / 255
+
+        batch["task"] = self.task
+        batch["robot_type"] = self.robot_type
+        return batch
+
+
+def predict_action(
+    observation: dict,
+    policy: ACTPolicy,
+    stager: ObservationStager,
+    preprocessor: PolicyProcessorPipeline,
+    postprocessor: PolicyProcessorPipeline,
+) -> torch.Tensor:
+    """
+    Same pipeline as `control_utils.predict_action`, with `stager` in place of
+    `prepare_observation_for_inference`: stage, preprocess (normalize), select the action and
+    postprocess it (unnormalize, move to CPU). Grad mode and autocast are left to the caller.
+    """
+    batch = preprocessor(stager(observation))
+    action = policy.select_action(batch)
+    return postprocessor(action)
+
+
+def inference_context(device: str, use_bf16: bool):
+    """Return the autocast context policy inference runs under (bf16 only applies on CUDA)."""
+    if use_bf16 and device.startswith("cuda"):
+        return torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+    return nullcontext()
+
+
+def compile_policy(policy: torch.nn.Module) -> None:
+    """
+    Compile the ACT network in place with CUDA graphs ("reduce-overhead") for fixed input shapes.
+
+    Only `policy.model` is compiled: `select_action` manages a Python deque of queued actions
+    which is not graph-capturable, while the network forward has static shapes for the whole run.
+    """
+    policy.model = torch.compile(policy.model, mode="reduce-overhead", dynamic=False)
+
+
+def warmup_policy(
+    policy: ACTPolicy,
+    observation: dict,
+    stager: ObservationStager,
+    preprocessor: PolicyProcessorPipeline,
+    device: str,
+    use_bf16: bool,
+    num_calls: int = 2,
+) -> None:
+    """Run a few forward passes so compilation and graph capture happen before the first episode."""
+    with torch.inference_mode(), inference_context(device, use_bf16):
+        for _ in range(num_calls):
+            policy.predict_action_chunk(preprocessor(stager(observation)))
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    policy.reset()
+
+
+def capture_cuda_graph(
+    policy: ACTPolicy,
+    observation: dict,
+    stager: ObservationStager,
+    preprocessor: PolicyProcessorPipeline,
+    use_bf16: bool,
+    num_warmup: int = 3,
+) -> None:
+    """
+    Capture `policy.predict_action_chunk` in a CUDA graph and replace it with a graph replay.
+
+    Observations have the same shapes for the whole run, so the network is recorded once on static
+    input tensors; every later call copies the new batch into those tensors and replays the graph,
+    which launches all kernels with a single CPU call. `select_action` keeps its Python action queue
+    / temporal ensembling and only calls the replayed chunk prediction when it needs a new chunk.
+    ACT has no data-dependent control flow at inference, so the recorded kernels are valid for any input.
+    """
+    # Autocast's weight cache must be disabled while capturing: cached casts would otherwise be freed
+    # after capture while the graph still points at them
+    autocast = (
+        torch.autocast(device_type="cuda", dtype=torch.bfloat16, cache_enabled=False)
+        if use_bf16
+        else nullcontext()
+    )
+    predict_action_chunk = policy.predict_action_chunk
+
+    with torch.inference_mode(), autocast:
+        batch = preprocessor(stager(observation))
+        static_batch = {key: value.clone() for key, value in batch.items() if isinstance(value, torch.Tensor)}
+
+        # Warm up on a side stream so lazy initialization (cuDNN / cuBLAS handles, autotuning) is not
+        # recorded into the graph
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream):
+            for _ in range(num_warmup):
+                predict_action_chunk(static_batch)
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_actions = predict_action_chunk(static_batch)
+    torch.cuda.synchronize()
+
+    def replay_action_chunk(batch: dict[str, torch.Tensor]) -> torch.Tensor:
+        for key, static_input in static_batch.items():
+            static_input.copy_(batch[key], non_blocking=True)
+        graph.replay()
+        # The next replay overwrites the static output, so hand out a copy
+        return static_actions.clone()
+
+    policy.predict_action_chunk = replay_action_chunk
+    policy.reset()
+
+
+class PolicyWorker:
+    """
+    Policy inference thread shared by all evaluation episodes.
+
+    torch.compile's "reduce-overhead" CUDA graphs are recorded per thread, so the warm-up (`setup`)
+    and every later inference call run on this one thread instead of a new thread per episode.
+    Observations and actions are tagged with the episode index: the policy is reset on this thread
+    when the first observation of a new episode arrives, and an action computed for a previous
+    episode is never handed out.
+    """
+
+    def __init__(
+        self,
+        policy: ACTPolicy,
+        stager: ObservationStager,
+        preprocessor: PolicyProcessorPipeline,
+        postprocessor: PolicyProcessorPipeline,
+        to_robot_action: PolicyActionToRobotActionProcessorStep,
+        device: str,
+        use_bf16: bool,
+        setup: Callable[[], None] | None = None,
+    ):
+        self._policy = policy
+        self._stager = stager
+        self._preprocessor = preprocessor
+        self._postprocessor = postprocessor
+        self._to_robot_action = to_robot_action
+        self._device = device
+        self._use_bf16 = use_bf16
+        self._setup = setup
+        self._obs_slot = LatestSlot()
+        self._action_slot = LatestSlot()
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self.error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True, name="PolicyWorker")
+        self._thread.start()
+
+    def wait_ready(self) -> None:
+        """Block until `setup` has finished on the worker thread. Re-raises its error."""
+        self._ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def submit(self, episode_idx: int, observation: dict) -> None:
+        self._obs_slot.put((episode_idx, observation))
+
+    def latest_action(self, episode_idx: int) -> dict | None:
+        """Return the most recent action computed for `episode_idx`, or None if there is none yet."""
+        item = self._action_slot.latest()
+        if item is None or item[0] != episode_idx:
+            return None
+        return item[1]
+
+    def close(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        obs_version = 0
+        current_episode = None
+        try:
+            # Grad mode and autocast are thread-local, so they are entered here, once for the whole
+            # run, rather than around every policy call
+            with torch.inference_mode(), inference_context(self._device, self._use_bf16):
+                if self._setup is not None:
+                    self._setup()
+                self._ready.set()
+
+                while not self._stop_event.is_set():
+                    new_obs = self._obs_slot.wait_newer(obs_version, timeout=0.1)
+                    if new_obs is None:
+                        continue
+                    (episode_idx, observation), obs_version = new_obs
+
+                    if episode_idx != current_episode:
+                        self._policy.reset()
+                        current_episode = episode_idx
+
+                    action = predict_action(
+                        observation, self._policy, self._stager, self._preprocessor, self._postprocessor
+                    )
+
+                    # Convert to a dict of Python floats here, so the device sync happens on this thread
+                    # and the control loop only ever handles ready-to-send values
+                    self._action_slot.put((episode_idx, self._to_robot_action.action(action.squeeze(0))))
+        except Exception as e:
+            self.error = e
+        finally:
+            self._ready.set()
 
 
 def evaluate_episode(
     robot: YaskawaNHC12Robot,
-    policy: torch.nn.Module,
+    worker: PolicyWorker,
     episode_idx: int,
     max_steps: int,
     fps: int,
-) -> dict:
+    log_queue: queue.Queue,
+) -> tuple[int, float]:
     """
     Run one evaluation episode.
 
+    Robot I/O (observation + action) runs at a fixed rate on the calling thread while policy
+    inference runs on the worker thread. Both sides exchange only their most recent item, so a
+    slow inference step delays the next action instead of stalling the control loop; until a
+    new action arrives the last one is held.
+
     Args:
         robot: Connected YASKAWA robot
-        policy: Trained ACT policy
+        worker: Policy inference thread, shared by all episodes
         episode_idx: Current episode number
         max_steps: Maximum number of steps
         fps: Control frequency in Hz
+        log_queue: Queue of the background `log_say` thread, used for in-loop status messages
 
     Returns:
-        Dictionary with episode statistics
+        Number of steps executed and episode duration in seconds
     """
     log_say(f"Episode {episode_idx + 1}/{NUM_EPISODES}")
     log_say("Position the robot at the starting pose and press Enter...")
@@ -110,22 +414,21 @@ def evaluate_episode(
     log_say("Starting episode...")
 
     step_count = 0
-    start_time = time.time()
-    episode_rewards = []
+    dropped_ticks = 0
+    period = 1.0 / fps
+    start_time = time.perf_counter()
+    next_tick = start_time + period
 
     try:
-        while step_count < max_steps:
-            step_start = time.time()
-
-            # Get observation from robot
+        while step_count < max_steps and worker.error is None:
+            # Get observation from robot and hand it over to the policy worker
             observation = robot.get_observation()
+            worker.submit(episode_idx, observation)
 
-            # Get action from policy
-            with torch.no_grad():
-                action = policy.select_action(observation)
-
-            # Send action to robot
-            robot.send_action(action)
+            # Send the most recent action, if the policy has produced one for this episode yet
+            action = worker.latest_action(episode_idx)
+            if action is not None:
+                robot.send_action(action)
 
             # Log data for visualization
             try:
@@ -137,26 +440,29 @@ def evaluate_episode(
 
             # Status update
             if step_count % (fps * 5) == 0:  # Every 5 seconds
-                elapsed = time.time() - start_time
-                log_say(f"Step {step_count}/{max_steps} ({elapsed:.1f}s)")
-
-            # Maintain control frequency
-            elapsed_step = time.time() - step_start
-            sleep_time = (1.0 / fps) - elapsed_step
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+                elapsed = time.perf_counter() - start_time
+                log_queue.put_nowait(f"Step {step_count}/{max_steps} ({elapsed:.1f}s)")
+
+            # Maintain control frequency against an absolute deadline. On overrun, restart the
+            # schedule from now instead of firing several late ticks back to back.
+            now = time.perf_counter()
+            if now > next_tick:
+                dropped_ticks += 1
+                next_tick = now + period
+            else:
+                precise_sleep_until(next_tick)
+                next_tick += period
 
     except KeyboardInterrupt:
         log_say("Episode interrupted by user")
 
-    total_time = time.time() - start_time
-    log_say(f"Episode completed: {step_count} steps in {total_time:.1f}s")
+    if worker.error is not None:
+        raise worker.error
+
+    total_time = time.perf_counter() - start_time
+    log_say(f"Episode completed: {step_count} steps in {total_time:.1f}s ({dropped_ticks} overrun ticks)")
 
-    return {
-        "episode_idx": episode_idx,
-        "num_steps": step_count,
-        "duration": total_time,
-    }
+    return step_count, total_time
 
 
 def main():
@@ -179,8 +485,30 @@ def main():
         default=NUM_EPISODES,
         help="Number of episodes to evaluate",
     )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the policy network with torch.compile (mode='reduce-overhead')",
+    )
+    parser.add_argument(
+        "--bf16",
+        action="store_true",
+        help="Run policy inference under bf16 autocast (CUDA only)",
+    )
+    parser.add_argument(
+        "--cuda_graphs",
+        action="store_true",
+        help="Capture the policy network in a CUDA graph and replay it every step (CUDA only)",
+    )
     args = parser.parse_args()
 
+    if args.cuda_graphs:
+        if not args.device.startswith("cuda"):
+            parser.error("--cuda_graphs requires a CUDA device")
+        if args.compile:
+            # mode="reduce-overhead" already runs the compiled network through CUDA graphs
+            parser.error("--cuda_graphs and --compile are mutually exclusive")
+
     log_say("YASKAWA NHC12 ACT Policy Evaluation")
     log_say("=" * 50)
 
@@ -192,6 +520,7 @@ def main():
         joint_names=JOINT_NAMES,
         joint_limits_deg=JOINT_LIMITS,
         cameras=CAMERA_CONFIGS,
+        drain_stale_frames=True,  # Always act on the newest camera frame
         enable_direct_teach=False,  # Disable direct teach for automatic control
         use_degrees=True,
     )
@@ -208,31 +537,70 @@ def main():
 
     # Load policy
     log_say(f"Loading policy from {args.policy_path}...")
-    policy = make_policy(
-        policy_path=args.policy_path,
-        device=args.device,
+    policy_config = PreTrainedConfig.from_pretrained(args.policy_path)
+    policy_config.device = args.device
+    policy = ACTPolicy.from_pretrained(args.policy_path, config=policy_config)
+    # The normalization stats are stored with the pretrained processors
+    preprocessor, postprocessor = make_pre_post_processors(
+        policy_cfg=policy.config,
+        pretrained_path=args.policy_path,
+        preprocessor_overrides={"device_processor": {"device": args.device}},
     )
     log_say("Policy loaded successfully")
 
+    stager = ObservationStager(robot.observation_features, args.device, robot_type=robot.name)
+
+    if args.compile:
+        log_say("Compiling policy (first calls will be slow)...")
+        compile_policy(policy)
+
+    # Graph capture / compilation run on the worker thread, which then serves every episode
+    setup = None
+    if args.cuda_graphs:
+        log_say("Capturing policy in a CUDA graph...")
+        setup = partial(capture_cuda_graph, policy, robot.get_observation(), stager, preprocessor, args.bf16)
+    elif args.compile or args.bf16:
+        # Absorb compilation / autotuning cost before the robot starts moving
+        setup = partial(
+            warmup_policy, policy, robot.get_observation(), stager, preprocessor, args.device, args.bf16
+        )
+
+    worker = PolicyWorker(
+        policy,
+        stager,
+        preprocessor,
+        postprocessor,
+        PolicyActionToRobotActionProcessorStep(motor_names=robot.config.joint_names),
+        args.device,
+        args.bf16,
+        setup=setup,
+    )
+
     # Initialize visualization
     init_rerun(session_name="yaskawa_nhc12_evaluation")
 
+    log_queue = start_log_say_thread()
+
     try:
+        worker.wait_ready()
+
         # Run evaluation episodes
-        episode_stats = []
+        num_episodes = args.num_episodes
+        episode_steps = np.zeros(num_episodes, dtype=np.int64)
+        episode_durations = np.zeros(num_episodes, dtype=np.float64)
 
-        for episode_idx in range(args.num_episodes):
+        for episode_idx in range(num_episodes):
             log_say("")
             log_say("-" * 50)
 
-            stats = evaluate_episode(
+            episode_steps[episode_idx], episode_durations[episode_idx] = evaluate_episode(
                 robot=robot,
-                policy=policy,
+                worker=worker,
                 episode_idx=episode_idx,
                 max_steps=MAX_STEPS_PER_EPISODE,
                 fps=FPS,
+                log_queue=log_queue,
             )
-            episode_stats.append(stats)
 
         # Print summary
         log_say("")
@@ -240,25 +608,20 @@ def main():
         log_say("Evaluation Summary")
         log_say("-" * 50)
 
-        total_steps = sum(s["num_steps"] for s in episode_stats)
-        total_time = sum(s["duration"] for s in episode_stats)
-        avg_steps = total_steps / len(episode_stats)
-        avg_time = total_time / len(episode_stats)
-
-        log_say(f"Total episodes: {len(episode_stats)}")
-        log_say(f"Total steps: {total_steps}")
-        log_say(f"Total time: {total_time:.1f}s")
-        log_say(f"Average steps per episode: {avg_steps:.1f}")
-        log_say(f"Average time per episode: {avg_time:.1f}s")
+        log_say(f"Total episodes: {num_episodes}")
+        log_say(f"Total steps: {episode_steps.sum()}")
+        log_say(f"Total time: {episode_durations.sum():.1f}s")
+        log_say(f"Average steps per episode: {episode_steps.mean():.1f}")
+        log_say(f"Average time per episode: {episode_durations.mean():.1f}s")
 
         # Ask user for success rate
         log_say("")
         log_say("Please manually assess the success rate:")
-        log_say(f"How many episodes were successful? (0-{len(episode_stats)})")
+        log_say(f"How many episodes were successful? (0-{num_episodes})")
         try:
             success_count = int(input().strip())
-            success_rate = (success_count / len(episode_stats)) * 100
-            log_say(f"Success rate: {success_rate:.1f}% ({success_count}/{len(episode_stats)})")
+            success_rate = (success_count / num_episodes) * 100
+            log_say(f"Success rate: {success_rate:.1f}% ({success_count}/{num_episodes})")
         except ValueError:
             log_say("Invalid input, skipping success rate calculation")
 
@@ -267,6 +630,9 @@ def main():
         raise
 
     finally:
+        worker.close()
+        log_queue.put(None)
+
         # Disconnect robot
         log_say("Disconnecting robot...")
         robot.disconnect()
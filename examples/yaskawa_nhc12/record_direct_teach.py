@@ -30,14 +30,19 @@ Controls during recording:
     - Press 'q' to quit
 """
 
+import logging
+import queue
+import threading
 import time
 
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.datasets.utils import combine_feature_dicts
+from lerobot.datasets.utils import build_dataset_frame, hw_to_dataset_features
 from lerobot.robots.yaskawa_nhc12 import YaskawaNHC12Config, YaskawaNHC12Robot
+from lerobot.utils.constants import ACTION, OBS_STR
 from lerobot.utils.control_utils import init_keyboard_listener
-from lerobot.utils.utils import log_say
+from lerobot.utils.robot_utils import precise_sleep_until
+from lerobot.utils.utils import log_say, start_log_say_thread
 from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
 
 # ========================================
@@ -83,14 +88,67 @@ JOINT_NAMES = [
     "joint_6",
 ]
 
-JOINT_LIMITS = {
-    "joint_1": (-170.0, 170.0),
-    "joint_2": (-130.0, 90.0),
-    "joint_3": (-170.0, 90.0),
-    "joint_4": (-200.0, 200.0),
-    "joint_5": (-135.0, 135.0),
-    "joint_6": (-360.0, 360.0),
-}
+# (min, max) in degrees for each joint, in JOINT_NAMES order
+JOINT_LIMITS = (
+    (-170.0, 170.0),  # joint_1
+    (-130.0, 90.0),  # joint_2
+    (-170.0, 90.0),  # joint_3
+    (-200.0, 200.0),  # joint_4
+    (-135.0, 135.0),  # joint_5
+    (-360.0, 360.0),  # joint_6
+)
+
+
+class FrameWriter:
+    """
+    Adds frames to the dataset on a single background thread, in submission order.
+
+    `dataset.add_frame` validates every frame and hands images over to the image writer, which is
+    too slow to run inside the recording loop's tick budget. Frames are queued instead; when the
+    queue is full `put` blocks (backpressure) rather than dropping frames, since a dropped frame
+    would shift every following timestamp in the episode. If adding a frame fails, the next `put`
+    raises the error so the recording stops right away instead of at the end of the episode.
+    """
+
+    def __init__(self, dataset: LeRobotDataset, task: str, max_pending: int):
+        self._dataset = dataset
+        self._task = task
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True, name="FrameWriter")
+        self._thread.start()
+
+    def put(self, observation: dict, action: dict) -> None:
+        if self._error is not None:
+            raise self._error
+        try:
+            self._queue.put_nowait((observation, action))
+        except queue.Full:
+            logging.warning("Frame writer is falling behind, blocking the recording loop until it catches up")
+            self._queue.put((observation, action))
+
+    def close(self) -> None:
+        """Wait for all queued frames to be added, then stop the thread. Re-raises worker errors."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        features = self._dataset.features
+        while (item := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            observation, action = item
+            try:
+                frame = {
+                    **build_dataset_frame(features, observation, prefix=OBS_STR),
+                    **build_dataset_frame(features, action, prefix=ACTION),
+                    "task": self._task,
+                }
+                self._dataset.add_frame(frame)
+            except Exception as e:
+                self._error = e
 
 
 def record_episode(
@@ -99,6 +157,7 @@ def record_episode(
     episode_idx: int,
     fps: int,
     max_duration_s: float,
+    log_queue: queue.Queue,
 ) -> bool:
     """
     Record a single episode using direct teach.
@@ -109,6 +168,7 @@ def record_episode(
         episode_idx: Current episode number
         fps: Recording frequency in Hz
         max_duration_s: Maximum episode duration in seconds
+        log_queue: Queue of the background `log_say` thread, used for in-loop status messages
 
     Returns:
         True if episode was recorded successfully, False if user wants to re-record
@@ -122,25 +182,25 @@ def record_episode(
 
     frame_count = 0
     max_frames = int(fps * max_duration_s)
-    start_time = time.time()
+    dropped_ticks = 0
+    period = 1.0 / fps
+    start_time = time.perf_counter()
+    next_tick = start_time + period
+    frame_writer = FrameWriter(dataset, task=TASK_DESCRIPTION, max_pending=fps * 2)
+    # Looked up once: the action keys do not change during an episode
+    action_keys = tuple(robot.action_features)
 
     try:
         while frame_count < max_frames:
-            frame_start = time.time()
-
             # Get observation (joint positions + camera images)
             observation = robot.get_observation()
 
             # In direct teach mode, the action is the same as observation
             # (we record where the robot is, not where we command it to go)
-            action = {
-                key: value
-                for key, value in observation.items()
-                if key in robot.action_features
-            }
+            action = {key: observation[key] for key in action_keys}
 
-            # Add frame to dataset
-            dataset.add_frame(observation, action)
+            # Add frame to dataset (on the frame writer thread)
+            frame_writer.put(observation, action)
 
             # Visualize data if rerun is initialized
             try:
@@ -152,20 +212,27 @@ def record_episode(
 
             # Status update every second
             if frame_count % fps == 0:
-                elapsed = time.time() - start_time
-                log_say(f"Recorded {frame_count} frames ({elapsed:.1f}s)")
-
-            # Sleep to maintain FPS
-            elapsed_frame = time.time() - frame_start
-            sleep_time = (1.0 / fps) - elapsed_frame
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+                elapsed = time.perf_counter() - start_time
+                log_queue.put_nowait(f"Recorded {frame_count} frames ({elapsed:.1f}s)")
+
+            # Maintain FPS against an absolute deadline. On overrun, restart the schedule from
+            # now instead of recording several late frames back to back.
+            now = time.perf_counter()
+            if now > next_tick:
+                dropped_ticks += 1
+                next_tick = now + period
+            else:
+                precise_sleep_until(next_tick)
+                next_tick += period
 
     except KeyboardInterrupt:
         log_say("Recording interrupted by user")
 
-    total_time = time.time() - start_time
-    log_say(f"Episode recorded: {frame_count} frames in {total_time:.1f}s")
+    finally:
+        frame_writer.close()
+
+    total_time = time.perf_counter() - start_time
+    log_say(f"Episode recorded: {frame_count} frames in {total_time:.1f}s ({dropped_ticks} overrun ticks)")
 
     # Ask if user wants to keep or re-record
     log_say("Keep this episode? (y/n/q to quit)")
@@ -196,6 +263,7 @@ def main():
         joint_names=JOINT_NAMES,
         joint_limits_deg=JOINT_LIMITS,
         cameras=CAMERA_CONFIGS,
+        drain_stale_frames=False,  # Record every captured frame instead of skipping to the newest
         enable_direct_teach=True,  # Enable direct teach mode
         use_degrees=True,
     )
@@ -212,10 +280,12 @@ def main():
 
     # Create dataset
     log_say(f"Creating dataset: {HF_REPO_ID}")
+    action_features = hw_to_dataset_features(robot.action_features, ACTION)
+    obs_features = hw_to_dataset_features(robot.observation_features, OBS_STR)
     dataset = LeRobotDataset.create(
         repo_id=HF_REPO_ID,
         fps=FPS,
-        features=robot.observation_features,  # Use robot's observation features
+        features={**action_features, **obs_features},
         robot_type=robot.name,
         use_videos=True,
         image_writer_threads=4,
@@ -224,6 +294,8 @@ def main():
     # Initialize visualization
     init_rerun(session_name="yaskawa_nhc12_direct_teach")
 
+    log_queue = start_log_say_thread()
+
     try:
         episode_idx = 0
         while episode_idx < NUM_EPISODES:
@@ -237,6 +309,7 @@ def main():
                 episode_idx=episode_idx,
                 fps=FPS,
                 max_duration_s=EPISODE_TIME_SEC,
+                log_queue=log_queue,
             )
 
             if result is None:
@@ -268,6 +341,8 @@ def main():
         raise
 
     finally:
+        log_queue.put(None)
+
         # Disconnect robot
         log_say("Disconnecting robot...")
         robot.disconnect()
@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from numbers import Real
 
 from lerobot.cameras import CameraConfig
 from lerobot.robots.config import RobotConfig
@@ -53,31 +55,53 @@ class YaskawaNHC12Config(RobotConfig):
     # Camera configurations (RealSense cameras supported)
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
+    # Camera intake policy for get_observation():
+    # - True: latest wins. Return the newest frame captured by the camera's background thread
+    #   without waiting, so a slow control step never makes the loop work through stale frames.
+    #   Best for policy deployment.
+    # - False: wait for a frame that has not been returned yet, so consecutive observations
+    #   never repeat an image. Best for data collection.
+    drain_stale_frames: bool = True
+
     # Connection timeout in seconds
     connection_timeout: float = 5.0
 
+    # Disable Nagle's algorithm so small command packets are sent immediately instead of being held
+    # back until the previous packet is acknowledged (can add up to ~40ms per command round-trip)
+    tcp_nodelay: bool = True
+
+    # Re-arm TCP_QUICKACK after every receive so the controller's reply is acknowledged right away
+    # instead of after the delayed-ACK timeout. Linux only, ignored on other platforms.
+    tcp_quickack: bool = True
+
     # Communication cycle time in seconds (how often to read/write data)
     cycle_time: float = 0.008  # 8ms = 125Hz
 
+    # Let step() send the move command and the joint position read as one combined
+    # "MOVE_JOINT ...;READ_JOINT_POS" command, answered with the joint positions. Only enable this if
+    # the controller's command server supports it; otherwise step() pipelines the two commands.
+    fused_step: bool = False
+
     # Enable direct teach mode (gravity compensation)
     enable_direct_teach: bool = True
 
-    # Joint limits in degrees (min, max for each joint)
+    # Joint limits in degrees, one (min, max) pair per joint in `joint_names` order
     # TODO: Update these based on your robot's specifications
-    joint_limits_deg: dict[str, tuple[float, float]] = field(default_factory=lambda: {
-        "joint_1": (-170.0, 170.0),
-        "joint_2": (-130.0, 90.0),
-        "joint_3": (-170.0, 90.0),
-        "joint_4": (-200.0, 200.0),
-        "joint_5": (-135.0, 135.0),
-        "joint_6": (-360.0, 360.0),
-    })
+    joint_limits_deg: tuple[tuple[float, float], ...] = (
+        (-170.0, 170.0),
+        (-130.0, 90.0),
+        (-170.0, 90.0),
+        (-200.0, 200.0),
+        (-135.0, 135.0),
+        (-360.0, 360.0),
+    )
 
     # Maximum joint velocity in degrees per second
     # TODO: Update based on your robot's safe operating parameters
     max_joint_velocity_deg_s: float = 100.0
 
-    # Use degrees instead of radians for joint angles
+    # Use degrees instead of radians for joint angles. Joint positions are parsed from the controller's
+    # ASCII replies (2 decimals) and handled as float32 by the robot.
     use_degrees: bool = True
 
     # Safety parameters
@@ -94,9 +118,27 @@ class YaskawaNHC12Config(RobotConfig):
                 f"num_joints ({self.num_joints})"
             )
 
-        # Validate joint limits are provided for all joints
-        if self.enable_safety_limits and len(self.joint_limits_deg) != self.num_joints:
+        # Validate one (min, max) pair of joint limits is provided per joint, in joint_names order
+        if isinstance(self.joint_limits_deg, Mapping) or not isinstance(self.joint_limits_deg, Sequence):
+            raise ValueError(
+                "Joint limits must be a sequence of (min, max) pairs in joint_names order, "
+                f"got {type(self.joint_limits_deg).__name__}."
+            )
+        if len(self.joint_limits_deg) != self.num_joints:
             raise ValueError(
                 f"Joint limits must be provided for all {self.num_joints} joints. "
                 f"Got {len(self.joint_limits_deg)} limits."
             )
+        for name, limits in zip(self.joint_names, self.joint_limits_deg, strict=True):
+            if not (
+                isinstance(limits, Sequence)
+                and len(limits) == 2
+                and all(isinstance(v, Real) and not isinstance(v, bool) for v in limits)
+            ):
+                raise ValueError(
+                    f"Joint limits for {name} must be a (min, max) pair of numbers, got {limits!r}."
+                )
+            if limits[0] > limits[1]:
+                raise ValueError(
+                    f"Joint limits for {name} have min {limits[0]} greater than max {limits[1]}."
+                )
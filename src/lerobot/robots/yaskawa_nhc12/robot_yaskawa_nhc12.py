@@ -17,12 +17,19 @@
 from __future__ import annotations
 
 import logging
+import re
+import selectors
 import socket
 import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from operator import itemgetter
 from typing import Any
 
 import numpy as np
 
+from lerobot.cameras import Camera
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.processor import RobotAction, RobotObservation
 from lerobot.robots.robot import Robot
@@ -31,6 +38,18 @@ from .config_yaskawa_nhc12 import YaskawaNHC12Config
 
 logger = logging.getLogger(__name__)
 
+# Fixed commands, encoded once
+_READ_JOINT_POS_COMMAND = b"READ_JOINT_POS\r\n"
+_TEACH_MODE_ON_COMMAND = b"TEACH_MODE ON\r\n"
+_TEACH_MODE_OFF_COMMAND = b"TEACH_MODE OFF\r\n"
+
+# Joint values of a READ_JOINT_POS reply ("J1=10.5,J2=-20.3,..."), matched on the raw bytes so the reply
+# never has to be decoded (float() accepts ASCII bytes)
+_JOINT_POSITION_RE = re.compile(rb"J\d+=(-?\d+(?:\.\d+)?)")
+
+# socket.sendmsg is not available on Windows
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
 
 class YaskawaNHC12Robot(Robot):
     """
@@ -60,20 +79,60 @@ class YaskawaNHC12Robot(Robot):
 
         # TCP/IP socket for communication
         self._socket: socket.socket | None = None
+        # Single source of truth for the connection state, only True while `_socket` is open. Hot paths
+        # check it directly instead of going through the `is_connected` property.
         self._connected = False
+        # Once connected the socket is non-blocking; this selector waits for it when no data is ready
+        self._selector: selectors.BaseSelector | None = None
+        # Commands queued by `_queue_command`, sent together by `_flush_commands`
+        self._queued_fragments: list[bytes] = []
+        self._num_queued_commands = 0
+        # TCP_QUICKACK is reset by the kernel after each ACK, so it has to be set again after every recv
+        self._tcp_quickack = config.tcp_quickack and hasattr(socket, "TCP_QUICKACK")
+
+        # Receive buffer allocated once and reused for every response. `_rx_len` bytes at its start
+        # have been received but not consumed yet (the beginning of the next response, if any).
+        self._rx_buf = bytearray(8192)
+        self._rx_mv = memoryview(self._rx_buf)
+        self._rx_len = 0
 
         # Current joint positions (in degrees or radians based on config)
-        self._current_joint_positions = np.zeros(config.num_joints)
+        # Joint positions are kept as float32 throughout (readings, targets, limits): the controller reports
+        # them with 2 decimals, well within float32 precision
+        self._current_joint_positions = np.zeros(config.num_joints, dtype=np.float32)
+
+        # Joint limits as min/max arrays aligned with joint_names, built once so that the safety check
+        # is a few vectorized comparisons instead of a lookup per joint
+        joint_limits = np.array(config.joint_limits_deg, dtype=np.float32).reshape(config.num_joints, 2)
+        self._joint_limits_min = joint_limits[:, 0].copy()
+        self._joint_limits_max = joint_limits[:, 1].copy()
+
+        # Joint position keys ("<joint>.pos") of observations and actions, formatted once. The getter pulls
+        # all target positions out of an action in a single C call, into a buffer reused for every command
+        self._joint_pos_keys = tuple(f"{joint_name}.pos" for joint_name in config.joint_names)
+        self._get_action_values = itemgetter(*self._joint_pos_keys)
+        self._action_buf = np.zeros(config.num_joints, dtype=np.float32)
+
+        # Move command template for a fixed number of joints (b"MOVE_JOINT J1=%.2f,...,J6=%.2f\r\n"), so
+        # each command is a single %-format of the positions straight to bytes, instead of formatting and
+        # joining per joint and then encoding
+        self._move_joint_fmt = (
+            "MOVE_JOINT " + ",".join(f"J{i + 1}=%.2f" for i in range(config.num_joints)) + "\r\n"
+        ).encode("ascii")
+        # Fused move + read command used by `step()` when `config.fused_step` is enabled
+        self._move_and_read_fmt = self._move_joint_fmt[:-2] + b";" + _READ_JOINT_POS_COMMAND
 
         # Direct teach mode state
         self._direct_teach_enabled = False
 
         # Initialize cameras
         self.cameras = make_cameras_from_configs(config.cameras)
+        # One worker per camera, created on connect, so all frames are read concurrently
+        self._camera_pool: ThreadPoolExecutor | None = None
 
         logger.info(f"Initialized YASKAWA NHC12 robot with {config.num_joints} joints")
 
-    @property
+    @cached_property
     def observation_features(self) -> dict[str, Any]:
         """Define the observation space (joint positions + camera images)."""
         features = {}
@@ -88,7 +147,7 @@ class YaskawaNHC12Robot(Robot):
 
         return features
 
-    @property
+    @cached_property
     def action_features(self) -> dict[str, type]:
         """Define the action space (target joint positions)."""
         return {f"{joint_name}.pos": float for joint_name in self.config.joint_names}
@@ -96,7 +155,7 @@ class YaskawaNHC12Robot(Robot):
     @property
     def is_connected(self) -> bool:
         """Check if the robot is connected."""
-        return self._connected and self._socket is not None
+        return self._connected
 
     def connect(self, calibrate: bool = False) -> None:
         """
@@ -109,11 +168,21 @@ class YaskawaNHC12Robot(Robot):
             # Create TCP socket
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.settimeout(self.config.connection_timeout)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if self.config.tcp_nodelay:
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Connect to controller
             logger.info(f"Connecting to YASKAWA NHC12 at {self.config.ip_address}:{self.config.port}")
             self._socket.connect((self.config.ip_address, self.config.port))
 
+            # A socket with a timeout polls before every send/recv, even when data is already there.
+            # In non-blocking mode the call is tried first and the selector is only used when it would block.
+            self._socket.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._socket, selectors.EVENT_READ)
+
+            self._rx_len = 0
             self._connected = True
             logger.info("Successfully connected to YASKAWA NHC12")
 
@@ -121,18 +190,30 @@ class YaskawaNHC12Robot(Robot):
             for cam_name, cam in self.cameras.items():
                 logger.info(f"Connecting camera: {cam_name}")
                 cam.connect()
+            # Cameras configured without an explicit width/height only know their frame size once
+            # connected, so drop any observation features cached before that
+            self.__dict__.pop("observation_features", None)
+            if self.cameras:
+                self._camera_pool = ThreadPoolExecutor(
+                    max_workers=len(self.cameras), thread_name_prefix="yaskawa_nhc12_camera"
+                )
 
             # Configure the robot
             self.configure()
 
-        except socket.timeout:
-            raise ConnectionError(
-                f"Connection timeout: Could not connect to YASKAWA NHC12 at "
-                f"{self.config.ip_address}:{self.config.port}. "
-                f"Please check the IP address and ensure the controller is powered on."
-            )
         except Exception as e:
-            raise ConnectionError(f"Failed to connect to YASKAWA NHC12: {e}")
+            # Release everything set up so far (socket, selector, cameras, camera pool) so a failed
+            # connect leaves the robot fully disconnected. Whether the controller processed the queued
+            # teach mode command is unknown, so don't try to turn it off again.
+            self._direct_teach_enabled = False
+            self.disconnect()
+            if isinstance(e, TimeoutError):
+                raise ConnectionError(
+                    f"Connection timeout: Could not connect to YASKAWA NHC12 at "
+                    f"{self.config.ip_address}:{self.config.port}. "
+                    f"Please check the IP address and ensure the controller is powered on."
+                ) from e
+            raise ConnectionError(f"Failed to connect to YASKAWA NHC12: {e}") from e
 
     def configure(self) -> None:
         """
@@ -146,7 +227,7 @@ class YaskawaNHC12Robot(Robot):
         if not self.is_connected:
             raise RuntimeError("Robot is not connected. Call connect() first.")
 
-        # TODO: Send configuration commands to the controller
+        # TODO: Queue configuration commands for the controller with `_queue_command`
         # Example commands (update based on YASKAWA protocol):
         # - Set control mode to position control
         # - Enable servo power
@@ -159,12 +240,17 @@ class YaskawaNHC12Robot(Robot):
         if self.config.enable_direct_teach:
             self._enable_direct_teach_mode()
 
+        # Send all queued configuration commands in a single round-trip
+        self._flush_commands()
+
         logger.info("Configuration complete")
 
     def _enable_direct_teach_mode(self) -> None:
         """
         Enable direct teach mode (gravity compensation).
 
+        The commands are queued; they are sent by the `_flush_commands()` call at the end of `configure()`.
+
         TODO: Implement the specific command sequence for your YASKAWA controller.
         This typically involves:
         1. Sending a command to enable gravity compensation
@@ -173,10 +259,8 @@ class YaskawaNHC12Robot(Robot):
         """
         logger.info("Enabling direct teach mode...")
 
-        # TODO: Send direct teach enable command
-        # Example (update based on actual protocol):
-        # command = "TEACH_MODE ON\r\n"
-        # self._send_command(command)
+        # TODO: Update the direct teach enable command based on the actual protocol
+        self._queue_command(_TEACH_MODE_ON_COMMAND)
 
         self._direct_teach_enabled = True
         logger.info("Direct teach mode enabled")
@@ -188,63 +272,189 @@ class YaskawaNHC12Robot(Robot):
 
         logger.info("Disabling direct teach mode...")
 
-        # TODO: Send direct teach disable command
-        # Example:
-        # command = "TEACH_MODE OFF\r\n"
-        # self._send_command(command)
+        # TODO: Update the direct teach disable command based on the actual protocol
+        self._send_command(_TEACH_MODE_OFF_COMMAND)
 
         self._direct_teach_enabled = False
         logger.info("Direct teach mode disabled")
 
-    def _send_command(self, command: str | bytes) -> str:
+    def _send_command(self, *fragments: bytes) -> str:
         """
         Send a command to the YASKAWA controller and receive response.
 
         Args:
-            command: Command string or bytes to send
+            fragments: ASCII command bytes to send, optionally split into several pieces (e.g. a
+                constant command header and a per-call payload) that are sent back to back
 
         Returns:
-            Response from the controller
-
-        TODO: Implement based on YASKAWA NHC12 protocol specification.
+            Response from the controller, without its trailing CRLF
         """
-        if not self.is_connected:
+        if not self._connected:
             raise RuntimeError("Robot is not connected")
 
         try:
-            # Convert string to bytes if needed
-            if isinstance(command, str):
-                command = command.encode('utf-8')
-
             # Send command
-            self._socket.sendall(command)
+            self._send_fragments(fragments)
 
             # Receive response
-            response = self._socket.recv(4096)
-            return response.decode('utf-8')
+            return self._receive_response().decode('utf-8')
 
         except Exception as e:
             logger.error(f"Communication error: {e}")
             raise
 
-    def _read_joint_positions(self) -> np.ndarray:
+    def _queue_command(self, *fragments: bytes) -> None:
+        """
+        Queue a command to be sent by the next `_flush_commands()` call.
+
+        Args:
+            fragments: ASCII command bytes, as for `_send_command`
+        """
+        self._queued_fragments.extend(fragments)
+        self._num_queued_commands += 1
+
+    def _flush_commands(self) -> list[str]:
         """
-        Read current joint positions from the controller.
+        Send all queued commands with a single write, then receive their responses.
+
+        The controller answers commands in order, so a burst of N commands costs one round-trip
+        instead of N. Meant for setup sequences, not for the per-step commands.
 
         Returns:
-            Array of joint positions (in degrees or radians based on config)
+            Responses from the controller in command order, without their trailing CRLF
+        """
+        if not self._connected:
+            raise RuntimeError("Robot is not connected")
 
-        TODO: Implement based on YASKAWA NHC12 protocol.
-        Example command: "READ_JOINT_POS\r\n"
-        Expected response format: "J1=10.5,J2=20.3,J3=30.1,J4=40.2,J5=50.0,J6=60.1\r\n"
+        fragments, num_commands = self._queued_fragments, self._num_queued_commands
+        self._queued_fragments, self._num_queued_commands = [], 0
+        if not num_commands:
+            return []
+
+        try:
+            self._send_fragments(fragments)
+            return [self._receive_response().decode("utf-8") for _ in range(num_commands)]
+
+        except Exception as e:
+            logger.error(f"Communication error: {e}")
+            raise
+
+    def _send_fragments(self, fragments: Sequence[bytes]) -> None:
+        """
+        Send all fragments as one contiguous message, with a single gather write in the common case.
+
+        `sendmsg` hands every fragment to the kernel in one syscall without joining them in Python
+        first. Like `send`, it may accept only part of the data, in which case the rest is sent by
+        further calls once the socket is writable again.
+        """
+        sock = self._socket
+        if _HAS_SENDMSG:
+            send = sock.sendmsg
+            views = [memoryview(f) for f in fragments]
+        else:
+            send = sock.send
+            views = [memoryview(b"".join(fragments))]
+        while views:
+            try:
+                sent = send(views) if _HAS_SENDMSG else send(views[0])
+            except BlockingIOError:
+                # Send buffer full: wait until the socket is writable again
+                self._selector.modify(sock, selectors.EVENT_WRITE)
+                try:
+                    self._wait_for_socket()
+                finally:
+                    self._selector.modify(sock, selectors.EVENT_READ)
+                continue
+            # Drop the fully sent fragments and trim the partially sent one
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if views and sent:
+                views[0] = views[0][sent:]
+
+    def _wait_for_socket(self) -> None:
+        """Wait for the events the socket is registered for, up to `config.connection_timeout`."""
+        if not self._selector.select(timeout=self.config.connection_timeout):
+            raise TimeoutError(f"No response from YASKAWA NHC12 within {self.config.connection_timeout}s")
+
+    def _receive_response(self) -> bytes:
+        """
+        Receive one CRLF-terminated response from the controller.
+
+        TCP is a byte stream: a response may arrive split over several segments, or together with the
+        start of the next one. Bytes are read into the preallocated receive buffer until a full line
+        is available; anything received past the terminator is kept for the next call.
+
+        Replies are variable-length ASCII lines, so the length cannot be known up front and a single
+        `recv_into(..., MSG_WAITALL)` is not an option (it is also ignored on a non-blocking socket).
+
+        Returns:
+            The response, without its trailing CRLF
+        """
+        # Bound to locals once: this runs for every reply on the control path
+        buf = self._rx_buf
+        rx_mv = self._rx_mv
+        recv_into = self._socket.recv_into
+        setsockopt = self._socket.setsockopt
+        tcp_quickack = self._tcp_quickack
+        rx_len = self._rx_len
+        end = buf.find(b"\r\n", 0, rx_len)
+        while end < 0:
+            if rx_len == len(buf):
+                # Discard the oversized line, otherwise every later call would fail the same way
+                self._rx_len = 0
+                raise ConnectionError(f"Response exceeds {len(buf)} bytes without a line terminator")
+            try:
+                n = recv_into(rx_mv[rx_len:])
+            except BlockingIOError:
+                self._wait_for_socket()
+                continue
+            if n == 0:
+                raise ConnectionError("Connection closed by the controller")
+            if tcp_quickack:
+                setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            # Start one byte early in case the CR was the last byte of the previous read
+            start = max(rx_len - 1, 0)
+            rx_len += n
+            # Stored right away so bytes already received are kept if waiting for the rest fails
+            self._rx_len = rx_len
+            end = buf.find(b"\r\n", start, rx_len)
+
+        response = bytes(rx_mv[:end])
+        consumed = end + 2
+        remaining = rx_len - consumed
+        if remaining:
+            buf[:remaining] = rx_mv[consumed:rx_len]
+        self._rx_len = remaining
+        return response
+
+    def _request_joint_positions(self) -> None:
+        """
+        Ask the controller for the current joint positions, without waiting for the reply.
+
+        Call `_receive_joint_positions()` afterwards to read the reply; anything done in between
+        (e.g. waiting for camera frames) overlaps with the round-trip to the controller.
+
+        Command format: "READ_JOINT_POS\r\n"
+        """
+        self._send_fragments([_READ_JOINT_POS_COMMAND])
+
+    def _receive_joint_positions(self) -> np.ndarray:
         """
-        # TODO: Send read position command and parse response
-        # command = "READ_JOINT_POS\r\n"
-        # response = self._send_command(command)
-        # positions = self._parse_joint_positions(response)
-        # return positions
+        Receive the reply to `_request_joint_positions()` into `_current_joint_positions`.
 
-        # Placeholder: return last known positions
+        Returns:
+            Array of joint positions (in degrees or radians based on config), updated in place
+
+        Expected response format: "J1=10.5,J2=20.3,J3=30.1,J4=40.2,J5=50.0,J6=60.1\r\n"
+        """
+        response = self._receive_response()
+        values = _JOINT_POSITION_RE.findall(response)
+        if len(values) != self.config.num_joints:
+            raise ValueError(
+                f"Expected {self.config.num_joints} joint positions in response, got {response!r}"
+            )
+        self._current_joint_positions[:] = list(map(float, values))
         return self._current_joint_positions
 
     def _write_joint_positions(self, positions: np.ndarray) -> None:
@@ -254,9 +464,17 @@ class YaskawaNHC12Robot(Robot):
         Args:
             positions: Target joint positions (in degrees or radians based on config)
 
-        TODO: Implement based on YASKAWA NHC12 protocol.
-        Example command: "MOVE_JOINT J1=10.5,J2=20.3,J3=30.1,J4=40.2,J5=50.0,J6=60.1\r\n"
+        Command format: "MOVE_JOINT J1=10.50,J2=20.30,J3=30.10,J4=40.20,J5=50.00,J6=60.10\r\n"
+        TODO: Update the command format in `__init__` to match your controller's protocol.
         """
+        self._send_command(self._format_move_command(self._move_joint_fmt, positions))
+
+        # Formatting the array is not free, skip it entirely unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent joint positions: %s", positions)
+
+    def _format_move_command(self, fmt: bytes, positions: np.ndarray) -> bytes:
+        """Validate target positions (clamping them in place if configured) and format them into `fmt`."""
         if len(positions) != self.config.num_joints:
             raise ValueError(
                 f"Expected {self.config.num_joints} joint positions, got {len(positions)}"
@@ -266,38 +484,34 @@ class YaskawaNHC12Robot(Robot):
         if self.config.enable_safety_limits:
             self._check_safety_limits(positions)
 
-        # TODO: Format and send move command
-        # Example:
-        # joint_str = ",".join([f"J{i+1}={pos:.2f}" for i, pos in enumerate(positions)])
-        # command = f"MOVE_JOINT {joint_str}\r\n"
-        # self._send_command(command)
-
-        logger.debug(f"Sent joint positions: {positions}")
+        return fmt % tuple(positions.tolist())
 
     def _check_safety_limits(self, positions: np.ndarray) -> None:
         """
         Check if joint positions are within safety limits.
 
         Args:
-            positions: Joint positions to check
+            positions: Joint positions to check (clamped in place if limits are exceeded and
+                `emergency_stop_on_limit` is disabled)
 
         Raises:
             ValueError: If any joint position exceeds limits
         """
-        for i, (joint_name, pos) in enumerate(zip(self.config.joint_names, positions)):
-            if joint_name in self.config.joint_limits_deg:
-                min_pos, max_pos = self.config.joint_limits_deg[joint_name]
-                if pos < min_pos or pos > max_pos:
-                    error_msg = (
-                        f"Joint {joint_name} position {pos:.2f} exceeds limits "
-                        f"[{min_pos:.2f}, {max_pos:.2f}]"
-                    )
-                    logger.error(error_msg)
-                    if self.config.emergency_stop_on_limit:
-                        raise ValueError(error_msg)
-                    else:
-                        logger.warning(f"{error_msg} - Clamping to limits")
-                        positions[i] = np.clip(pos, min_pos, max_pos)
+        out_of_limits = (positions < self._joint_limits_min) | (positions > self._joint_limits_max)
+        if not out_of_limits.any():
+            return
+
+        error_msg = "; ".join(
+            f"Joint {self.config.joint_names[i]} position {positions[i]:.2f} exceeds limits "
+            f"[{self._joint_limits_min[i]:.2f}, {self._joint_limits_max[i]:.2f}]"
+            for i in np.flatnonzero(out_of_limits)
+        )
+        logger.error(error_msg)
+        if self.config.emergency_stop_on_limit:
+            raise ValueError(error_msg)
+
+        logger.warning(f"{error_msg} - Clamping to limits")
+        np.clip(positions, self._joint_limits_min, self._joint_limits_max, out=positions)
 
     @property
     def is_calibrated(self) -> bool:
@@ -312,27 +526,110 @@ class YaskawaNHC12Robot(Robot):
         """
         Get current observation from the robot (joint positions + camera images).
 
+        Camera images are the cameras' own frame arrays, returned without copying. With
+        `drain_stale_frames` enabled, two consecutive observations can hold the same array when no new
+        frame was captured in between, so callers must copy an image before modifying it in place.
+
         Returns:
             RobotObservation dictionary with joint positions and camera images
         """
-        if not self.is_connected:
+        if not self._connected:
             raise RuntimeError("Robot is not connected")
 
-        observation = {}
+        # Start capturing camera images first, so the frames are read in parallel with each other and
+        # with the joint position round-trip to the controller
+        camera_futures = self._start_camera_reads()
+        self._request_joint_positions()
+        return self._collect_observation(camera_futures)
 
-        # Read joint positions
-        self._current_joint_positions = self._read_joint_positions()
+    def step(self, action: RobotAction) -> RobotObservation:
+        """
+        Send an action and return the observation that follows it, in a single round-trip.
 
-        # Add joint positions to observation
-        for joint_name, pos in zip(self.config.joint_names, self._current_joint_positions):
-            observation[f"{joint_name}.pos"] = float(pos)
+        Equivalent to `send_action(action)` followed by `get_observation()`, but the move command and
+        the joint position read go out in one write. With `config.fused_step` they are combined into a
+        single "MOVE_JOINT ...;READ_JOINT_POS" command answered with the joint positions; otherwise both
+        commands are pipelined and their two replies are read back in order. In direct teach mode no
+        move command is sent, as in `send_action`.
 
-        # Capture camera images
-        for cam_name, cam in self.cameras.items():
-            observation[cam_name] = cam.get_image()
+        Args:
+            action: Dictionary of target joint positions
+
+        Returns:
+            RobotObservation dictionary with joint positions and camera images
+        """
+        if not self._connected:
+            raise RuntimeError("Robot is not connected")
+
+        if self._direct_teach_enabled:
+            logger.debug("Direct teach mode active - not sending position commands")
+            return self.get_observation()
+
+        camera_futures = self._start_camera_reads()
+
+        target_positions = self._action_buf
+        target_positions[:] = self._get_action_values(action)
+        if self.config.fused_step:
+            self._send_fragments([self._format_move_command(self._move_and_read_fmt, target_positions)])
+        else:
+            move_command = self._format_move_command(self._move_joint_fmt, target_positions)
+            self._send_fragments([move_command, _READ_JOINT_POS_COMMAND])
+            return self._collect_observation(camera_futures, move_reply_pending=True)
+
+        return self._collect_observation(camera_futures)
+
+    def _start_camera_reads(self) -> dict[str, Future]:
+        """Submit a frame read for every camera to the camera pool."""
+        return {
+            cam_name: self._camera_pool.submit(self._read_camera, cam)
+            for cam_name, cam in self.cameras.items()
+        }
+
+    def _collect_observation(
+        self, camera_futures: dict[str, Future], move_reply_pending: bool = False
+    ) -> RobotObservation:
+        """
+        Build the observation from the camera reads and the pending joint position reply.
+
+        With `move_reply_pending`, the reply to a pipelined move command is still queued ahead of the
+        joint position reply and is read (and discarded) first.
+        """
+        observation = {}
+
+        try:
+            if move_reply_pending:
+                self._receive_response()
+                move_reply_pending = False
+
+            # Collect camera images
+            for cam_name, future in camera_futures.items():
+                observation[cam_name] = future.result()
+        finally:
+            # Both replies are always drained, even if reading the move reply or a camera failed, otherwise
+            # every later command would read the reply meant for the previous one.
+            if move_reply_pending:
+                self._receive_response()
+            self._receive_joint_positions()
+
+        # Add joint positions to observation, converted to Python floats in a single call. For a handful of
+        # joints this plain loop is as fast as observation.update(zip(...)) or merging a template dict.
+        for key, pos in zip(self._joint_pos_keys, self._current_joint_positions.tolist(), strict=True):
+            observation[key] = pos
 
         return observation
 
+    def _read_camera(self, cam: Camera) -> np.ndarray:
+        """
+        Read one frame according to `config.drain_stale_frames`.
+
+        Cameras capture continuously on their own background thread and only keep the newest
+        frame, so `read_latest()` never hands out a frame older than the last capture, no matter
+        how long the previous control step took.
+        """
+        if self.config.drain_stale_frames:
+            return cam.read_latest()
+        return cam.async_read()
+
     def send_action(self, action: RobotAction) -> RobotAction:
         """
         Send action command to the robot.
@@ -343,14 +640,12 @@ class YaskawaNHC12Robot(Robot):
         Returns:
             The action that was actually sent (potentially clipped)
         """
-        if not self.is_connected:
+        if not self._connected:
             raise RuntimeError("Robot is not connected")
 
         # Extract joint positions from action
-        target_positions = np.array([
-            action[f"{joint_name}.pos"]
-            for joint_name in self.config.joint_names
-        ])
+        target_positions = self._action_buf
+        target_positions[:] = self._get_action_values(action)
 
         # If in direct teach mode, don't send commands (robot is manually controlled)
         if self._direct_teach_enabled:
@@ -367,10 +662,16 @@ class YaskawaNHC12Robot(Robot):
         logger.info("Disconnecting from YASKAWA NHC12...")
 
         # Disable direct teach mode if enabled
-        if self._direct_teach_enabled:
-            self._disable_direct_teach_mode()
+        if self._direct_teach_enabled and self.is_connected:
+            try:
+                self._disable_direct_teach_mode()
+            except Exception as e:
+                logger.warning(f"Error disabling direct teach mode: {e}")
 
         # Disconnect cameras
+        if self._camera_pool is not None:
+            self._camera_pool.shutdown(wait=True)
+            self._camera_pool = None
         for cam_name, cam in self.cameras.items():
             try:
                 cam.disconnect()
@@ -378,6 +679,10 @@ class YaskawaNHC12Robot(Robot):
                 logger.warning(f"Error disconnecting camera {cam_name}: {e}")
 
         # Close socket connection
+        self._connected = False
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
         if self._socket is not None:
             try:
                 self._socket.close()
@@ -386,5 +691,4 @@ class YaskawaNHC12Robot(Robot):
             finally:
                 self._socket = None
 
-        self._connected = False
         logger.info("Disconnected from YASKAWA NHC12")
@@ -53,3 +53,22 @@ def precise_sleep(seconds: float, spin_threshold: float = 0.010, sleep_margin: f
     else:
         # On Linux time.sleep is accurate enough for most uses
         time.sleep(seconds)
+
+
+def precise_sleep_until(deadline: float, spin_margin: float = 0.0003):
+    """
+    Wait until `time.perf_counter()` reaches `deadline`, sleeping coarsely then busy-spinning.
+
+    Meant for fixed-rate loops that keep an absolute deadline (`next_tick += period`) instead of
+    sleeping for "period minus elapsed", so timing errors do not accumulate over an episode.
+
+    Parameters:
+      - deadline: target time, in `time.perf_counter()` seconds
+      - spin_margin: time before the deadline at which to stop sleeping and spin. Default 300us, which
+        covers the wake-up latency of time.sleep on Linux.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_margin:
+        time.sleep(remaining - spin_margin)
+    while time.perf_counter() < deadline:
+        pass
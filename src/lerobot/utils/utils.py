@@ -16,9 +16,11 @@
 import logging
 import os
 import platform
+import queue
 import select
 import subprocess
 import sys
+import threading
 import time
 from copy import copy, deepcopy
 from datetime import datetime
@@ -230,6 +232,24 @@ def log_say(text: str, play_sounds: bool = True, blocking: bool = False):
         say(text, blocking)
 
 
+def start_log_say_thread() -> queue.Queue:
+    """
+    Start a daemon thread that runs `log_say` for every message put on the returned queue.
+
+    `log_say` spawns a text-to-speech process, which can take tens of milliseconds. Control loops can
+    `put_nowait` their messages instead, so speech never eats into the tick budget. Put `None` on the
+    queue to stop the thread.
+    """
+    log_queue: queue.Queue = queue.Queue()
+
+    def run() -> None:
+        for text in iter(log_queue.get, None):
+            log_say(text)
+
+    threading.Thread(target=run, daemon=True, name="LogSay").start()
+    return log_queue
+
+
 def get_channel_first_image_shape(image_shape: tuple) -> tuple:
     # Validate image_shape has exactly 3 elements
     if not isinstance(image_shape, (tuple, list)) or len(image_shape) != 3:
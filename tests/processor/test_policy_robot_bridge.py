@@ -119,6 +119,27 @@ def test_robot_to_policy_missing_motor_key_error():
         processor.action(robot_action)
 
 
+def test_robot_to_policy_returns_independent_tensors():
+    """Test that each call returns a new tensor instead of aliasing a shared buffer."""
+    processor = RobotActionToPolicyActionProcessorStep(motor_names=["joint1", "joint2"])
+
+    first = processor.action({"joint1.pos": 1.0, "joint2.pos": 2.0})
+    second = processor.action({"joint1.pos": 3.0, "joint2.pos": 4.0})
+
+    torch.testing.assert_close(first, torch.tensor([1.0, 2.0]))
+    torch.testing.assert_close(second, torch.tensor([3.0, 4.0]))
+
+
+def test_robot_to_policy_output_is_float32():
+    """Test that integer and double inputs are converted to a float32 tensor."""
+    processor = RobotActionToPolicyActionProcessorStep(motor_names=["joint1", "joint2"])
+
+    policy_action = processor.action({"joint1.pos": 1, "joint2.pos": 2.5})
+
+    assert policy_action.dtype == torch.float32
+    torch.testing.assert_close(policy_action, torch.tensor([1.0, 2.5]))
+
+
 def test_robot_to_policy_transform_features():
     """Test feature transformation for robot to policy action processor."""
     motor_names = ["joint1", "joint2", "joint3"]
@@ -229,6 +250,31 @@ def test_policy_to_robot_action_conversion_with_numpy_input():
     assert robot_action["joint2.pos"] == pytest.approx(2.5)
 
 
+def test_policy_to_robot_outputs_python_floats():
+    """Test that tensor and numpy inputs are converted to plain Python floats."""
+    import numpy as np
+
+    processor = PolicyActionToRobotActionProcessorStep(motor_names=["joint1", "joint2"])
+
+    for policy_action in (torch.tensor([1.5, 2.5]), np.array([1.5, 2.5]), [1.5, 2.5]):
+        robot_action = processor.action(policy_action)
+        assert robot_action == {"joint1.pos": 1.5, "joint2.pos": 2.5}
+        assert all(type(value) is float for value in robot_action.values())
+
+
+def test_policy_to_robot_returns_new_dict_each_call():
+    """Test that the output dict is not reused, so mutating it cannot affect later actions."""
+    processor = PolicyActionToRobotActionProcessorStep(motor_names=["joint1", "joint2"])
+
+    first = processor.action(torch.tensor([1.0, 2.0]))
+    first.pop("joint1.pos")
+    second = processor.action(torch.tensor([3.0, 4.0]))
+
+    assert first is not second
+    assert first == {"joint2.pos": 2.0}
+    assert second == {"joint1.pos": 3.0, "joint2.pos": 4.0}
+
+
 def test_policy_to_robot_action_length_mismatch_error():
     """Test error when policy action length doesn't match motor names."""
     motor_names = ["joint1", "joint2", "joint3"]
@@ -0,0 +1,484 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+from lerobot.robots.yaskawa_nhc12 import YaskawaNHC12Config, YaskawaNHC12Robot
+
+
+@pytest.fixture
+def robot(tmp_path):
+    cfg = YaskawaNHC12Config(id="test_yaskawa_nhc12", calibration_dir=tmp_path)
+    yield YaskawaNHC12Robot(cfg)
+
+
+@pytest.fixture
+def controller():
+    """Listening TCP socket standing in for the controller's command server."""
+    server = socket.create_server(("127.0.0.1", 0))
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_robot(tmp_path, controller):
+    """Build robots pointed at `controller`, for tests that set up the config or cameras before connecting."""
+    robots = []
+
+    def _make_robot(**overrides) -> YaskawaNHC12Robot:
+        overrides.setdefault("enable_direct_teach", False)
+        cfg = YaskawaNHC12Config(
+            id="test_yaskawa_nhc12",
+            calibration_dir=tmp_path,
+            ip_address="127.0.0.1",
+            port=controller.getsockname()[1],
+            **overrides,
+        )
+        robot = YaskawaNHC12Robot(cfg)
+        robots.append(robot)
+        return robot
+
+    yield _make_robot
+    for robot in robots:
+        if robot.is_connected:
+            robot.disconnect()
+
+
+@pytest.fixture
+def connected_robot(make_robot, controller):
+    robot = make_robot()
+    robot.connect()
+    conn, _ = controller.accept()
+    yield robot, conn
+    robot.disconnect()
+    conn.close()
+
+
+JOINT_POSITIONS_RESPONSE = b"J1=10.5,J2=20.3,J3=30.1,J4=40.2,J5=50.0,J6=-60.1\r\n"
+
+
+class BarrierCamera:
+    """Fake camera whose reads only complete once all cameras are being read at the same time."""
+
+    height, width = 4, 6
+
+    def __init__(self, barrier: threading.Barrier):
+        self._barrier = barrier
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def read_latest(self):
+        self._barrier.wait()
+        return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+
+def test_get_observation_reads_cameras_concurrently(make_robot, controller):
+    robot = make_robot()
+    barrier = threading.Barrier(2, timeout=5)
+    robot.cameras = {"wrist": BarrierCamera(barrier), "front": BarrierCamera(barrier)}
+    robot.connect()
+    conn, _ = controller.accept()
+    conn.sendall(JOINT_POSITIONS_RESPONSE)
+
+    try:
+        observation = robot.get_observation()
+    finally:
+        robot.disconnect()
+        conn.close()
+
+    assert observation["wrist"].shape == (4, 6, 3)
+    assert observation["front"].shape == (4, 6, 3)
+    assert robot._camera_pool is None
+
+
+def test_is_connected_follows_connect_and_disconnect(connected_robot):
+    robot, _ = connected_robot
+    assert robot.is_connected
+
+    robot.disconnect()
+
+    assert not robot.is_connected
+    with pytest.raises(RuntimeError, match="not connected"):
+        robot.get_observation()
+
+
+class FailingCamera(BarrierCamera):
+    """Fake camera whose first read fails, like `read_latest` on a stale or missing frame."""
+
+    def __init__(self):
+        self.fail = True
+
+    def read_latest(self):
+        if self.fail:
+            self.fail = False
+            raise TimeoutError("latest frame is too old")
+        return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+
+def test_get_observation_drains_joint_reply_when_camera_fails(make_robot, controller):
+    robot = make_robot()
+    robot.cameras = {"wrist": FailingCamera()}
+    robot.connect()
+    conn, _ = controller.accept()
+
+    try:
+        conn.sendall(b"J1=1.0,J2=1.0,J3=1.0,J4=1.0,J5=1.0,J6=1.0\r\n")
+        with pytest.raises(TimeoutError, match="too old"):
+            robot.get_observation()
+
+        conn.sendall(b"J1=2.0,J2=2.0,J3=2.0,J4=2.0,J5=2.0,J6=2.0\r\n")
+        observation = robot.get_observation()
+    finally:
+        robot.disconnect()
+        conn.close()
+
+    assert observation["joint_1.pos"] == 2.0
+
+
+class AutoSizeCamera(BarrierCamera):
+    """Fake camera that only learns its frame size on connect, like a RealSense without width/height."""
+
+    height = width = None
+
+    def __init__(self):
+        pass
+
+    def connect(self):
+        self.height, self.width = 4, 6
+
+
+def test_connect_refreshes_observation_features(make_robot):
+    robot = make_robot()
+    robot.cameras = {"wrist": AutoSizeCamera()}
+    assert robot.observation_features["wrist"] == (None, None, 3)
+
+    robot.connect()
+    try:
+        assert robot.observation_features["wrist"] == (4, 6, 3)
+    finally:
+        robot.disconnect()
+
+
+def test_connect_sets_socket_options(connected_robot):
+    robot, _ = connected_robot
+
+    assert robot._socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    assert robot._socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+
+def test_send_command_reassembles_split_response(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"J1=10.5,J2=")
+    conn.sendall(b"20.3\r")
+    conn.sendall(b"\n")
+
+    assert robot._send_command(b"READ_JOINT_POS\r\n") == "J1=10.5,J2=20.3"
+    assert conn.recv(64) == b"READ_JOINT_POS\r\n"
+
+
+def test_send_command_sends_fragments_as_one_message(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"OK\r\n")
+
+    assert robot._send_command(b"MOVE_JOINT ", b"J1=1.00\r\n") == "OK"
+    assert conn.recv(64) == b"MOVE_JOINT J1=1.00\r\n"
+
+
+@pytest.mark.skipif(not hasattr(socket.socket, "sendmsg"), reason="socket.sendmsg is not available")
+def test_send_fragments_resumes_partial_sends(robot):
+    class PartialSendSocket:
+        def __init__(self):
+            self.data = b""
+
+        def sendmsg(self, buffers):
+            # Accept at most 3 bytes per call
+            chunk = b"".join(bytes(b) for b in buffers)[:3]
+            self.data += chunk
+            return len(chunk)
+
+    robot._socket = PartialSendSocket()
+    robot._send_fragments([b"MOVE_JOINT ", b"", b"J1=1.00\r\n"])
+
+    assert robot._socket.data == b"MOVE_JOINT J1=1.00\r\n"
+
+
+def test_send_command_keeps_bytes_of_next_response(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"OK\r\nJ1=1.0\r\n")
+
+    assert robot._send_command(b"TEACH_MODE ON\r\n") == "OK"
+    assert robot._send_command(b"READ_JOINT_POS\r\n") == "J1=1.0"
+
+
+def test_receive_response_recovers_from_oversized_line(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"x" * len(robot._rx_buf))
+
+    with pytest.raises(ConnectionError, match="without a line terminator"):
+        robot._receive_response()
+
+    conn.sendall(b"OK\r\n")
+    assert robot._receive_response() == b"OK"
+
+
+def test_send_command_waits_for_late_response(connected_robot):
+    robot, conn = connected_robot
+    reply = threading.Timer(0.05, conn.sendall, args=(b"OK\r\n",))
+    reply.start()
+
+    assert robot._send_command(b"TEACH_MODE ON\r\n") == "OK"
+    reply.join()
+
+
+def test_send_command_times_out_without_response(connected_robot):
+    robot, _ = connected_robot
+    robot.config.connection_timeout = 0.05
+
+    with pytest.raises(TimeoutError, match="No response from YASKAWA NHC12"):
+        robot._send_command(b"READ_JOINT_POS\r\n")
+
+
+def test_flush_commands_sends_queued_commands_together(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"OK\r\nJ1=1.0\r\n")
+
+    robot._queue_command(b"TEACH_MODE ON\r\n")
+    robot._queue_command(b"READ_JOINT_POS", b"\r\n")
+
+    assert robot._flush_commands() == ["OK", "J1=1.0"]
+    assert conn.recv(64) == b"TEACH_MODE ON\r\nREAD_JOINT_POS\r\n"
+    assert robot._flush_commands() == []
+
+
+def test_connect_enables_direct_teach_mode(make_robot, controller):
+    robot = make_robot(enable_direct_teach=True)
+    received = []
+
+    def serve():
+        conn, _ = controller.accept()
+        with conn:
+            received.append(conn.recv(64))
+            conn.sendall(b"OK\r\n")
+            received.append(conn.recv(64))
+            conn.sendall(b"OK\r\n")
+
+    server = threading.Thread(target=serve)
+    server.start()
+    robot.connect()
+    assert robot._direct_teach_enabled
+
+    robot.disconnect()
+    server.join()
+    assert received == [b"TEACH_MODE ON\r\n", b"TEACH_MODE OFF\r\n"]
+
+
+def test_failed_configure_leaves_robot_disconnected(make_robot):
+    robot = make_robot(enable_direct_teach=True, connection_timeout=0.05)
+
+    # The controller accepts the connection but never answers TEACH_MODE ON
+    with pytest.raises(ConnectionError, match="Connection timeout"):
+        robot.connect()
+
+    assert not robot.is_connected
+    assert not robot._direct_teach_enabled
+    assert robot._socket is None
+    assert robot._selector is None
+
+
+def test_send_command_raises_when_controller_closes(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"partial")
+    conn.close()
+
+    with pytest.raises(ConnectionError, match="Connection closed"):
+        robot._send_command(b"READ_JOINT_POS\r\n")
+
+
+def test_get_observation_reads_joint_positions(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(JOINT_POSITIONS_RESPONSE)
+
+    observation = robot.get_observation()
+
+    assert conn.recv(64) == b"READ_JOINT_POS\r\n"
+    assert observation == pytest.approx(
+        {
+            "joint_1.pos": 10.5,
+            "joint_2.pos": 20.3,
+            "joint_3.pos": 30.1,
+            "joint_4.pos": 40.2,
+            "joint_5.pos": 50.0,
+            "joint_6.pos": -60.1,
+        }
+    )
+    assert all(type(value) is float for value in observation.values())
+
+
+def test_receive_joint_positions_accepts_integer_values(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"J1=10,J2=-20,J3=0.5,J4=-0.25,J5=0,J6=360\r\n")
+
+    positions = robot._receive_joint_positions()
+
+    np.testing.assert_array_equal(positions, [10.0, -20.0, 0.5, -0.25, 0.0, 360.0])
+
+
+def test_get_observation_rejects_wrong_joint_count(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"J1=10.5,J2=20.3\r\n")
+
+    with pytest.raises(ValueError, match="Expected 6 joint positions"):
+        robot.get_observation()
+
+
+def test_disable_direct_teach_mode_sends_command(connected_robot):
+    robot, conn = connected_robot
+    robot._direct_teach_enabled = True
+    conn.sendall(b"OK\r\n")
+
+    robot._disable_direct_teach_mode()
+
+    assert conn.recv(64) == b"TEACH_MODE OFF\r\n"
+    assert not robot._direct_teach_enabled
+
+
+def test_send_action_sends_move_command(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"OK\r\n")
+    action = {f"joint_{i}.pos": float(i) for i in range(1, 7)}
+    action["joint_2.pos"] = -20.125
+
+    robot.send_action(action)
+
+    assert conn.recv(128) == b"MOVE_JOINT J1=1.00,J2=-20.12,J3=3.00,J4=4.00,J5=5.00,J6=6.00\r\n"
+
+
+def test_features(robot):
+    expected = {f"joint_{i}.pos": float for i in range(1, 7)}
+
+    assert robot.observation_features == expected
+    assert robot.action_features == expected
+    assert robot.observation_features is robot.observation_features
+
+
+def test_step_pipelines_move_and_read(connected_robot):
+    robot, conn = connected_robot
+    conn.sendall(b"OK\r\n" + JOINT_POSITIONS_RESPONSE)
+    action = {f"joint_{i}.pos": float(i) for i in range(1, 7)}
+
+    observation = robot.step(action)
+
+    assert conn.recv(256) == (
+        b"MOVE_JOINT J1=1.00,J2=2.00,J3=3.00,J4=4.00,J5=5.00,J6=6.00\r\nREAD_JOINT_POS\r\n"
+    )
+    assert observation["joint_6.pos"] == pytest.approx(-60.1)
+
+
+def test_step_drains_both_replies_when_move_reply_is_late(connected_robot):
+    robot, conn = connected_robot
+    robot.config.connection_timeout = 0.2
+    # Arrives after the first read of the move reply timed out, but while it is being drained
+    reply = threading.Timer(0.3, conn.sendall, args=(b"OK\r\n" + JOINT_POSITIONS_RESPONSE,))
+    reply.start()
+    action = {f"joint_{i}.pos": float(i) for i in range(1, 7)}
+
+    with pytest.raises(TimeoutError, match="No response from YASKAWA NHC12"):
+        robot.step(action)
+    reply.join()
+
+    conn.sendall(b"J1=2.0,J2=2.0,J3=2.0,J4=2.0,J5=2.0,J6=2.0\r\n")
+    assert robot.get_observation()["joint_1.pos"] == 2.0
+
+
+def test_step_sends_fused_command(connected_robot):
+    robot, conn = connected_robot
+    robot.config.fused_step = True
+    conn.sendall(JOINT_POSITIONS_RESPONSE)
+    action = {f"joint_{i}.pos": float(i) for i in range(1, 7)}
+
+    observation = robot.step(action)
+
+    assert conn.recv(256) == (
+        b"MOVE_JOINT J1=1.00,J2=2.00,J3=3.00,J4=4.00,J5=5.00,J6=6.00;READ_JOINT_POS\r\n"
+    )
+    assert observation["joint_1.pos"] == pytest.approx(10.5)
+
+
+def test_safety_limits_within_range(robot):
+    positions = np.zeros(robot.config.num_joints)
+    robot._check_safety_limits(positions)
+    np.testing.assert_array_equal(positions, np.zeros(robot.config.num_joints))
+
+
+def test_safety_limits_raise_on_violation(robot):
+    positions = np.zeros(robot.config.num_joints)
+    positions[1] = 200.0
+
+    with pytest.raises(ValueError, match="Joint joint_2 position 200.00 exceeds limits"):
+        robot._check_safety_limits(positions)
+
+
+def test_safety_limits_log_all_violations_once(robot, caplog):
+    positions = np.array([0.0, 200.0, -500.0, 0.0, 0.0, 0.0])
+
+    with pytest.raises(ValueError, match="joint_2 .*; Joint joint_3"):
+        robot._check_safety_limits(positions)
+
+    errors = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert len(errors) == 1
+
+
+def test_safety_limits_clamp_in_place(robot):
+    robot.config.emergency_stop_on_limit = False
+    positions = np.array([0.0, 200.0, -500.0, 0.0, 0.0, 0.0])
+
+    robot._check_safety_limits(positions)
+
+    np.testing.assert_array_equal(positions, [0.0, 90.0, -170.0, 0.0, 0.0, 0.0])
+
+
+def test_config_rejects_mismatched_joint_limits(tmp_path):
+    with pytest.raises(ValueError, match="Joint limits must be provided for all 6 joints"):
+        YaskawaNHC12Config(
+            id="test_yaskawa_nhc12", calibration_dir=tmp_path, joint_limits_deg=((-170.0, 170.0),)
+        )
+
+
+@pytest.mark.parametrize(
+    "joint_limits_deg, match",
+    [
+        (
+            {f"joint_{i}": (-170.0, 170.0) for i in range(1, 7)},
+            "must be a sequence of \\(min, max\\) pairs in joint_names order, got dict",
+        ),
+        (((-170.0, 170.0),) * 5 + ((-10.0, 0.0, 10.0),), "joint_6 must be a \\(min, max\\) pair of numbers"),
+        (((-170.0, 170.0),) * 5 + (("-10", "10"),), "joint_6 must be a \\(min, max\\) pair of numbers"),
+        (((-170.0, 170.0),) * 5 + ((10.0, -10.0),), "joint_6 have min 10.0 greater than max -10.0"),
+    ],
+)
+def test_config_rejects_malformed_joint_limits(tmp_path, joint_limits_deg, match):
+    with pytest.raises(ValueError, match=match):
+        YaskawaNHC12Config(
+            id="test_yaskawa_nhc12", calibration_dir=tmp_path, joint_limits_deg=joint_limits_deg
+        )
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from lerobot.utils.robot_utils import precise_sleep_until
+
+
+def test_precise_sleep_until_does_not_return_early():
+    for delay in (0.0001, 0.002, 0.02):
+        deadline = time.perf_counter() + delay
+        precise_sleep_until(deadline)
+        assert time.perf_counter() >= deadline
+
+
+def test_precise_sleep_until_past_deadline_returns_immediately():
+    start = time.perf_counter()
+    precise_sleep_until(start - 1.0)
+    assert time.perf_counter() - start < 0.1